@@ -4,18 +4,121 @@ YouTube Playlist Auto-Downloader
 This module handles downloading videos from a YouTube playlist using yt-dlp.
 """
 
+import asyncio
+import atexit
+import copy
+import functools
 import json
 import logging
+import logging.handlers
+import os
+import queue
 import re
 import subprocess
 import sys
+import tempfile
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set, AsyncIterator
 
 from subtitle_syncer import SubtitleSyncer
 from playlist_manager import PlaylistManager
 
+# yt-dlp's Python package is optional; without it every call goes through the CLI
+try:
+    import yt_dlp
+except ImportError:
+    yt_dlp = None
+
+# Video ID in an SRT filename produced by the output template:
+# 20170405 - Title [VIDEO_ID].en.srt
+_SRT_ID_RE = re.compile(r'\[([A-Za-z0-9_-]{11})\]\.[^.\[\]]*\.srt$', re.ASCII)
+
+
+# Default cookie source: Chrome on macOS user's Library path
+_DEFAULT_CHROME_PROFILE = str(Path.home() / 'Library' / 'Application Support' / 'Google' / 'Chrome')
+
+
+def _resolve_cookie_args(options: Dict[str, Any]) -> List[str]:
+    """
+    Resolve the --cookies-from-browser arguments from yt-dlp options.
+
+    Config keys supported:
+      cookies_from_browser: string name of browser (e.g., 'chrome')
+      cookies_path: optional path to browser profile or cookies dir/file
+    If not provided, default to Chrome on macOS user profile directory.
+    Format: --cookies-from-browser BROWSER:PATH (single colon-separated arg)
+
+    Args:
+        options: The yt_dlp_options section of the configuration
+
+    Returns:
+        List of command arguments
+    """
+    cookies_browser = options.get('cookies_from_browser')
+    cookies_path = options.get('cookies_path') or options.get('cookies_from_browser_path')
+    if cookies_browser:
+        if cookies_path:
+            return ['--cookies-from-browser', f'{cookies_browser}:{cookies_path}']
+        return ['--cookies-from-browser', cookies_browser]
+    return ['--cookies-from-browser', f'chrome:{_DEFAULT_CHROME_PROFILE}']
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a configuration file, memoized on its path and modification time.
+
+    The mtime is part of the cache key, so editing the file invalidates the
+    cached entry. Callers must not mutate the returned dict.
+
+    Args:
+        path: Absolute path to the configuration file
+        mtime_ns: Modification time of the file in nanoseconds
+
+    Returns:
+        Parsed configuration dictionary
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+async def _read_output_lines(stream: asyncio.StreamReader) -> AsyncIterator[List[bytes]]:
+    """
+    Yield batches of non-empty output lines from a subprocess stream.
+
+    Reads the pipe in large chunks and splits lines locally, rather than
+    awaiting once per line. yt-dlp separates progress updates with a bare
+    carriage return when not attached to a terminal, so both \r and \n end
+    a line.
+
+    Args:
+        stream: The subprocess stdout stream
+
+    Yields:
+        Lists of output lines as bytes, without line terminators
+    """
+    buffer = bytearray()
+    while True:
+        data = await stream.read(65536)
+        if not data:
+            break
+        buffer += data
+        end = max(buffer.rfind(b'\n'), buffer.rfind(b'\r'))
+        if end < 0:
+            continue
+        chunk = bytes(buffer[:end])
+        del buffer[:end + 1]
+        lines = [line for line in chunk.replace(b'\r', b'\n').split(b'\n') if line]
+        if lines:
+            yield lines
+
+    # Flush a trailing line that has no terminator
+    if buffer:
+        yield [bytes(buffer)]
+
 
 class PlaylistDownloader:
     """Manages downloading videos from YouTube playlists."""
@@ -28,8 +131,12 @@ class PlaylistDownloader:
             config_path: Path to the configuration file
         """
         self.config_path = config_path
+        self._cached_cmd = None
         self.config = self._load_config()
+        self._cookie_args = _resolve_cookie_args(self.config.get('yt_dlp_options', {}))
+        self._srt_cmd_prefix = self._build_srt_command_prefix()
         self._setup_logging()
+        self._setup_yt_dlp_api()
         self._setup_directories()
         self._setup_subtitle_sync()
         self._setup_playlist_manager()
@@ -37,8 +144,9 @@ class PlaylistDownloader:
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from JSON file."""
         try:
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
+            st = os.stat(self.config_path)
+            config = _load_config_cached(str(Path(self.config_path).resolve()), st.st_mtime_ns)
+            return copy.deepcopy(config)
         except FileNotFoundError:
             print(f"Error: Configuration file '{self.config_path}' not found.")
             sys.exit(1)
@@ -62,22 +170,74 @@ class PlaylistDownloader:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
 
-        # Formatter
-        formatter = logging.Formatter(
+        # Formatters: timestamps only go to the log file; the console gets a
+        # minimal format that skips per-record time formatting
+        file_handler.setFormatter(logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
+        ))
+        console_handler.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+
+        # Hand records to a background listener so the download loop never
+        # blocks on file or console writes. The logger is shared by name, so
+        # close() detaches this instance's handler again.
+        self._log_queue = queue.Queue(-1)
+        self._log_handler = logging.handlers.QueueHandler(self._log_queue)
+        self._log_file_handler = file_handler
+        self.logger.addHandler(self._log_handler)
+        self._log_listener = logging.handlers.QueueListener(
+            self._log_queue, file_handler, console_handler
         )
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
+        self._log_listener.start()
+        atexit.register(self.close)
+
+    def close(self):
+        """Flush pending log records, stop the logging listener and detach its handler."""
+        if self._log_listener is not None:
+            self.logger.removeHandler(self._log_handler)
+            self._log_listener.stop()
+            self._log_file_handler.close()
+            self._log_listener = None
+
+    def _setup_yt_dlp_api(self):
+        """
+        Prepare in-process yt-dlp options when the yt_dlp package is available.
+
+        Subtitle and playlist info lookups then run through yt_dlp.YoutubeDL
+        instead of spawning a yt-dlp process (and re-importing every extractor)
+        each time. Set use_yt_dlp_api to false to always use the CLI.
+        """
+        self._ydl_srt_opts = None
+        self._ydl_info_opts = None
+
+        if not self.config.get('use_yt_dlp_api', True):
+            return
+        if yt_dlp is None:
+            self.logger.info("yt_dlp Python package not found, using the yt-dlp command line")
+            return
+
+        # Derive the options from the same arguments the CLI path uses, so
+        # both paths behave identically
+        quiet = {'quiet': True, 'noprogress': True}
+        try:
+            srt_opts = yt_dlp.parse_options(self._srt_cmd_prefix[1:]).ydl_opts
+            info_opts = yt_dlp.parse_options(['--flat-playlist', *self._cookie_args]).ydl_opts
+        except Exception as e:
+            # parse_options raises on arguments yt-dlp rejects; the CLI path
+            # then fails and logs the same way it always has
+            self.logger.warning(f"Could not prepare yt_dlp options, using the yt-dlp command line: {e}")
+            return
 
-        # Add handlers
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # parse_options defaults to ignoreerrors='only_download', which makes
+        # extract_info return None instead of raising when a video fails
+        self._ydl_srt_opts = {**srt_opts, **quiet, 'ignoreerrors': False}
+        self._ydl_info_opts = {**info_opts, **quiet, 'playlistend': 1}
 
     def _setup_directories(self):
         """Create necessary directories if they don't exist."""
         download_path = Path(self.config.get('download_path', './downloads'))
-        download_path.mkdir(parents=True, exist_ok=True)
+        if not download_path.is_dir():
+            download_path.mkdir(parents=True, exist_ok=True)
         self.logger.info(f"Download directory: {download_path.absolute()}")
 
     def _setup_subtitle_sync(self):
@@ -110,20 +270,63 @@ class PlaylistDownloader:
                 queue_file=self.config.get('download_queue_file', '.download_queue.txt'),
                 cookies_browser=options.get('cookies_from_browser'),
                 cookies_path=options.get('cookies_path') or options.get('cookies_from_browser_path'),
-                extractor_args=options.get('extractor_args')
+                extractor_args=options.get('extractor_args'),
+                fetch_timeout=self.config.get('playlist_fetch_timeout_seconds', 600),
+                cache_max_age=self.config.get('playlist_cache_max_age_hours', 24) * 3600
             )
             self.logger.info("Playlist manager initialized")
         except Exception as e:
             self.logger.error(f"Failed to setup playlist manager: {e}")
             self.playlist_manager = None
 
+    def _build_srt_command_prefix(self) -> List[str]:
+        """
+        Build the invariant part of the SRT download command.
+
+        Only the video URL changes between SRT downloads, so everything else
+        is assembled once and reused for every video.
+
+        Returns:
+            List of command arguments (without the video URL)
+        """
+        download_path = self.config.get('download_path', './downloads')
+        options = self.config.get('yt_dlp_options', {})
+
+        cmd = [
+            'yt-dlp',
+            '--skip-download',
+            '--write-subs',
+            '--write-auto-subs',
+            '--sub-langs', 'en',
+            '--convert-subs', 'srt',
+            '--paths', download_path,
+            *self._cookie_args,
+        ]
+
+        # Add output template (same as main download)
+        if 'output_template' in options:
+            cmd.extend(['--output', options['output_template']])
+
+        # Add extractor arguments (for bypassing YouTube restrictions)
+        if 'extractor_args' in options:
+            cmd.extend(['--extractor-args', options['extractor_args']])
+
+        return cmd
+
     def _build_yt_dlp_command(self) -> list:
         """
         Build the yt-dlp command with all options.
 
+        The command only depends on the configuration, which is loaded once in
+        __init__, so it is built on first use and copied thereafter; the cached
+        command lives as long as the instance.
+
         Returns:
             List of command arguments
         """
+        if self._cached_cmd is not None:
+            return list(self._cached_cmd)
+
         playlist_url = self.config.get('playlist_url')
         if not playlist_url or playlist_url == "https://www.youtube.com/playlist?list=YOUR_PLAYLIST_ID_HERE":
             self.logger.error("Please set a valid playlist_url in config.json")
@@ -140,23 +343,8 @@ class PlaylistDownloader:
             '--paths', download_path,
         ]
 
-        # Add cookies-from-browser: allow override via config (yt_dlp_options)
-        # Config keys supported:
-        #   cookies_from_browser: string name of browser (e.g., 'chrome')
-        #   cookies_path: optional path to browser profile or cookies dir/file
-        # If not provided, default to Chrome on macOS user profile directory.
-        # Format: --cookies-from-browser BROWSER:PATH (single colon-separated arg)
-        cookies_browser = options.get('cookies_from_browser')
-        cookies_path = options.get('cookies_path') or options.get('cookies_from_browser_path')
-        if cookies_browser:
-            if cookies_path:
-                cmd.extend(['--cookies-from-browser', f'{cookies_browser}:{cookies_path}'])
-            else:
-                cmd.extend(['--cookies-from-browser', cookies_browser])
-        else:
-            # Default: use Chrome on macOS user's Library path
-            default_chrome_path = str(Path.home() / 'Library' / 'Application Support' / 'Google' / 'Chrome')
-            cmd.extend(['--cookies-from-browser', f'chrome:{default_chrome_path}'])
+        # Add cookies-from-browser (resolved once in __init__)
+        cmd.extend(self._cookie_args)
 
         # Add format
         if 'format' in options:
@@ -205,7 +393,8 @@ class PlaylistDownloader:
         # Add playlist URL
         cmd.append(playlist_url)
 
-        return cmd
+        self._cached_cmd = cmd
+        return list(cmd)
 
     def _download_srt_for_video(self, video_id: str) -> bool:
         """
@@ -217,52 +406,21 @@ class PlaylistDownloader:
         Returns:
             True if successful, False otherwise
         """
+        if self._ydl_srt_opts is not None:
+            return self._download_srt_in_process([video_id])[video_id]
+
         try:
             video_url = f"https://www.youtube.com/watch?v={video_id}"
             self.logger.info(f"Downloading SRT subtitle for video: {video_id}")
 
-            download_path = self.config.get('download_path', './downloads')
-            options = self.config.get('yt_dlp_options', {})
-
-            # Build SRT download command
-            cmd = [
-                'yt-dlp',
-                '--skip-download',
-                '--write-subs',
-                '--write-auto-subs',
-                '--sub-langs', 'en',
-                '--convert-subs', 'srt',
-                '--paths', download_path,
-            ]
-
-            # Add cookies-from-browser (same as main download)
-            cookies_browser = options.get('cookies_from_browser')
-            cookies_path = options.get('cookies_path') or options.get('cookies_from_browser_path')
-            if cookies_browser:
-                if cookies_path:
-                    cmd.extend(['--cookies-from-browser', f'{cookies_browser}:{cookies_path}'])
-                else:
-                    cmd.extend(['--cookies-from-browser', cookies_browser])
-            else:
-                # Default: use Chrome on macOS user's Library path
-                default_chrome_path = str(Path.home() / 'Library' / 'Application Support' / 'Google' / 'Chrome')
-                cmd.extend(['--cookies-from-browser', f'chrome:{default_chrome_path}'])
-
-            # Add output template (same as main download)
-            if 'output_template' in options:
-                cmd.extend(['--output', options['output_template']])
-
-            # Add extractor arguments (for bypassing YouTube restrictions)
-            if 'extractor_args' in options:
-                cmd.extend(['--extractor-args', options['extractor_args']])
-
-            # Add video URL
-            cmd.append(video_url)
+            cmd = [*self._srt_cmd_prefix, video_url]
 
             # Execute yt-dlp for SRT download
+            # Only stderr is inspected, and only on failure
             result = subprocess.run(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=60
             )
@@ -281,6 +439,187 @@ class PlaylistDownloader:
             self.logger.error(f"Error downloading SRT for {video_id}: {e}")
             return False
 
+    def _download_srt_batch(self, video_ids: List[str]) -> Dict[str, bool]:
+        """
+        Download SRT subtitles for several videos with a single yt-dlp process.
+
+        The video URLs are fed to yt-dlp on stdin as a batch file, so process
+        startup, extractor import and cookie decryption are paid once rather
+        than once per video. A video counts as done once its SRT file is on
+        disk, which relies on the output template putting the video ID in
+        brackets in the filename (see _find_existing_srt_ids).
+
+        Args:
+            video_ids: YouTube video IDs
+
+        Returns:
+            Dictionary mapping each video ID to whether it succeeded
+        """
+        if self._ydl_srt_opts is not None:
+            return self._download_srt_in_process(video_ids)
+
+        results = {video_id: False for video_id in video_ids}
+        if not video_ids:
+            return results
+
+        try:
+            cmd = [*self._srt_cmd_prefix, '--ignore-errors', '-a', '-']
+            urls = '\n'.join(f"https://www.youtube.com/watch?v={video_id}" for video_id in video_ids)
+
+            # Only stderr is inspected, and only on failure
+            process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True
+            )
+            try:
+                _, errors = process.communicate(urls + '\n', timeout=60 * len(video_ids))
+            except subprocess.TimeoutExpired:
+                process.kill()
+                _, errors = process.communicate()
+                self.logger.error("SRT batch download timeout")
+
+            # Judge success by the SRT files on disk; yt-dlp announces each
+            # video's subtitles before fetching them, so its output can't tell
+            # a subtitle that then failed (e.g. HTTP 429) from one that arrived
+            present = self._find_existing_srt_ids()
+            for video_id in video_ids:
+                results[video_id] = video_id in present
+
+            for video_id, success in results.items():
+                if success:
+                    self.logger.info(f"Successfully downloaded SRT subtitle for {video_id}")
+                else:
+                    self.logger.warning(f"Failed to download SRT for {video_id}")
+            if errors and not all(results.values()):
+                self.logger.warning(f"yt-dlp errors:\n{errors.rstrip()}")
+            return results
+
+        except Exception as e:
+            self.logger.error(f"Error downloading SRT batch: {e}")
+            return results
+
+    def _download_srt_in_process(self, video_ids: List[str]) -> Dict[str, bool]:
+        """
+        Download SRT subtitles through the yt_dlp Python API.
+
+        A single YoutubeDL instance handles every video, so no process is
+        spawned at all. As with _download_srt_batch, a video counts as done
+        once its SRT file is on disk.
+
+        Args:
+            video_ids: YouTube video IDs
+
+        Returns:
+            Dictionary mapping each video ID to whether it succeeded
+        """
+        results = {video_id: False for video_id in video_ids}
+        extracted = []
+        try:
+            with yt_dlp.YoutubeDL(self._ydl_srt_opts) as ydl:
+                for video_id in video_ids:
+                    self.logger.info(f"Downloading SRT subtitle for video: {video_id}")
+                    try:
+                        ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}")
+                        extracted.append(video_id)
+                    except yt_dlp.utils.DownloadError as e:
+                        self.logger.warning(f"Failed to download SRT for {video_id}: {e}")
+        except Exception as e:
+            self.logger.error(f"Error downloading SRT subtitles: {e}")
+
+        if extracted:
+            present = self._find_existing_srt_ids()
+            for video_id in extracted:
+                if video_id in present:
+                    results[video_id] = True
+                    self.logger.info(f"Successfully downloaded SRT subtitle for {video_id}")
+                else:
+                    self.logger.warning(f"Failed to download SRT for {video_id}: no SRT file written")
+        return results
+
+    async def _download_srt_for_video_async(self, video_id: str, semaphore: asyncio.Semaphore) -> bool:
+        """
+        Download SRT subtitle for a specific video without blocking the event loop.
+
+        Args:
+            video_id: YouTube video ID
+            semaphore: Bounds how many SRT downloads run at once
+
+        Returns:
+            True if successful, False otherwise
+        """
+        async with semaphore:
+            if self._ydl_srt_opts is not None:
+                return await asyncio.get_running_loop().run_in_executor(
+                    None, self._download_srt_for_video, video_id
+                )
+
+            process = None
+            try:
+                video_url = f"https://www.youtube.com/watch?v={video_id}"
+                self.logger.info(f"Downloading SRT subtitle for video: {video_id}")
+
+                # Only stderr is inspected, and only on failure
+                process = await asyncio.create_subprocess_exec(
+                    *self._srt_cmd_prefix, video_url,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                _, stderr = await asyncio.wait_for(process.communicate(), timeout=60)
+
+                if process.returncode == 0:
+                    self.logger.info(f"Successfully downloaded SRT subtitle for {video_id}")
+                    return True
+                else:
+                    self.logger.warning(
+                        f"Failed to download SRT for {video_id}: {stderr.decode('utf-8', 'replace')}"
+                    )
+                    return False
+
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                self.logger.error(f"SRT download timeout for {video_id}")
+                return False
+            except Exception as e:
+                self.logger.error(f"Error downloading SRT for {video_id}: {e}")
+                return False
+
+    def _find_existing_srt_ids(self) -> Set[str]:
+        """
+        Collect the IDs of videos that already have an SRT file on disk.
+
+        Relies on the output template putting the video ID in brackets in the
+        filename, as the default template does.
+
+        Returns:
+            Set of video IDs
+        """
+        download_path = Path(self.config.get('download_path', './downloads'))
+        existing = set()
+        for srt_file in download_path.rglob('*.srt'):
+            match = _SRT_ID_RE.search(srt_file.name)
+            if match:
+                existing.add(match.group(1))
+        return existing
+
+    def _sync_subtitles(self, modified_before: Optional[float] = None):
+        """
+        Sync subtitles to Google Drive, logging rather than raising on failure.
+
+        Args:
+            modified_before: Only sync files last modified before this timestamp
+        """
+        try:
+            self.logger.info("Syncing subtitles to Google Drive...")
+            synced, skipped = self.subtitle_syncer.sync_subtitles(modified_before)
+            if synced > 0:
+                self.logger.info(f"Synced {synced} subtitle(s) to Google Drive")
+        except Exception as e:
+            self.logger.error(f"Failed to sync subtitles: {e}")
+
     def download_single_video(self, video_id: str) -> bool:
         """
         Download a single video and its subtitles.
@@ -309,17 +648,7 @@ class PlaylistDownloader:
             ]
 
             # Add cookies-from-browser
-            cookies_browser = options.get('cookies_from_browser')
-            cookies_path = options.get('cookies_path') or options.get('cookies_from_browser_path')
-            if cookies_browser:
-                if cookies_path:
-                    cmd.extend(['--cookies-from-browser', f'{cookies_browser}:{cookies_path}'])
-                else:
-                    cmd.extend(['--cookies-from-browser', cookies_browser])
-            else:
-                # Default: use Chrome on macOS user's Library path
-                default_chrome_path = str(Path.home() / 'Library' / 'Application Support' / 'Google' / 'Chrome')
-                cmd.extend(['--cookies-from-browser', f'chrome:{default_chrome_path}'])
+            cmd.extend(self._cookie_args)
 
             # Add format
             if 'format' in options:
@@ -376,18 +705,20 @@ class PlaylistDownloader:
             # Stream output
             download_success = False
             for line in process.stdout:
-                line = line.rstrip()
+                line = line[:-1] if line.endswith('\n') else line
                 if line:
-                    # Log important lines
-                    if '[download]' in line and 'Destination:' in line:
-                        self.logger.info(line)
-                        download_success = True
-                    elif 'has already been recorded' in line:
-                        self.logger.info(f"Video {video_id} already downloaded")
-                        download_success = True
-                    elif '[download] 100%' in line:
-                        self.logger.info(line)
-                    elif 'ERROR' in line or 'WARNING' in line:
+                    # Log important lines; progress updates are by far the
+                    # most common and fall through the [download] branch
+                    if line.startswith('[download]'):
+                        if line.startswith('[download] 100%'):
+                            self.logger.info(line)
+                        elif 'Destination:' in line:
+                            self.logger.info(line)
+                            download_success = True
+                        elif line.endswith('has already been recorded in the archive'):
+                            self.logger.info(f"Video {video_id} already downloaded")
+                            download_success = True
+                    elif line.startswith(('ERROR', 'WARNING')):
                         self.logger.warning(line)
 
             return_code = process.wait()
@@ -404,13 +735,7 @@ class PlaylistDownloader:
 
                 # Sync subtitles to Google Drive if enabled
                 if self.subtitle_syncer:
-                    try:
-                        self.logger.info("Syncing subtitles to Google Drive...")
-                        synced, skipped = self.subtitle_syncer.sync_subtitles()
-                        if synced > 0:
-                            self.logger.info(f"Synced {synced} subtitle(s) to Google Drive")
-                    except Exception as e:
-                        self.logger.error(f"Failed to sync subtitles: {e}")
+                    self._sync_subtitles()
 
                 self.logger.info("=" * 60)
                 return True
@@ -436,75 +761,7 @@ class PlaylistDownloader:
             self.logger.info("Starting playlist check and download")
             self.logger.info(f"Playlist: {self.config.get('playlist_url')}")
 
-            cmd = self._build_yt_dlp_command()
-            self.logger.info(f"Command: {' '.join(cmd)}")
-
-            # Execute yt-dlp
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
-            )
-
-            # Stream output and track downloaded video IDs
-            new_downloads = 0
-            downloaded_video_ids = []
-            for line in process.stdout:
-                line = line.rstrip()
-                if line:
-                    # Log important lines
-                    if '[download]' in line and 'Destination:' in line:
-                        self.logger.info(line)
-                        new_downloads += 1
-
-                        # Extract video ID from the destination line
-                        # Format: [download] Destination: downloads/WL-test/20170405 - Title [VIDEO_ID].ext
-                        video_id_match = re.search(r'\[([A-Za-z0-9_-]{11})\]\.', line)
-                        if video_id_match:
-                            video_id = video_id_match.group(1)
-                            downloaded_video_ids.append(video_id)
-                            self.logger.debug(f"Extracted video ID: {video_id}")
-                    elif 'has already been recorded' in line:
-                        # Video already downloaded
-                        pass
-                    elif 'ERROR' in line or 'WARNING' in line:
-                        self.logger.warning(line)
-                    elif '[download] 100%' in line:
-                        self.logger.info(line)
-
-            # Wait for completion
-            return_code = process.wait()
-
-            if return_code == 0:
-                if new_downloads > 0:
-                    self.logger.info(f"Successfully downloaded {new_downloads} new video(s)")
-
-                    # Download SRT subtitles for each newly downloaded video
-                    if downloaded_video_ids:
-                        self.logger.info(f"Downloading SRT subtitles for {len(downloaded_video_ids)} video(s)...")
-                        srt_success_count = 0
-                        for video_id in downloaded_video_ids:
-                            if self._download_srt_for_video(video_id):
-                                srt_success_count += 1
-                        self.logger.info(f"Downloaded {srt_success_count}/{len(downloaded_video_ids)} SRT subtitle(s)")
-
-                    # Sync subtitles to Google Drive if enabled
-                    if self.subtitle_syncer:
-                        try:
-                            self.logger.info("Syncing subtitles to Google Drive...")
-                            synced, skipped = self.subtitle_syncer.sync_subtitles()
-                            if synced > 0:
-                                self.logger.info(f"Synced {synced} subtitle(s) to Google Drive")
-                        except Exception as e:
-                            self.logger.error(f"Failed to sync subtitles: {e}")
-                else:
-                    self.logger.info("No new videos found in playlist")
-                return True
-            else:
-                self.logger.error(f"yt-dlp exited with code {return_code}")
-                return False
+            return asyncio.run(self._download_async())
 
         except ValueError as e:
             self.logger.error(f"Configuration error: {e}")
@@ -517,48 +774,179 @@ class PlaylistDownloader:
             self.logger.error(f"Unexpected error during download: {e}", exc_info=True)
             return False
 
+    async def _download_async(self) -> bool:
+        """
+        Run the playlist download, SRT fetches and subtitle sync as one pipeline.
+
+        When srt_batch is disabled, the SRT fetch for each video starts as soon
+        as yt-dlp finishes that video, overlapping with the rest of the
+        playlist download. Otherwise all SRT subtitles are fetched in a single
+        batch once the playlist download completes.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        # yt-dlp appends the ID of every video it finishes to this file. The
+        # after_video stage also runs with skip_download (subtitle-only
+        # configs), where after_move never fires.
+        ids_fd, ids_file = tempfile.mkstemp(prefix='yt-dlp-ids-', suffix='.txt')
+        os.close(ids_fd)
+
+        try:
+            cmd = self._build_yt_dlp_command()
+            cmd[-1:-1] = ['--print-to-file', 'after_video:%(id)s', ids_file]
+            self.logger.info(f"Command: {' '.join(cmd)}")
+
+            pipelined = not self.config.get('srt_batch', True)
+            semaphore = asyncio.Semaphore(self.config.get('srt_concurrency', 8))
+            srt_tasks = []
+            downloaded_video_ids = []
+            srt_needed = []
+            existing_srt = self._find_existing_srt_ids()
+            download_started = time.time()
+
+            # Execute yt-dlp
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT
+            )
+
+            with open(ids_file, 'r') as ids:
+                pending_ids = ''
+
+                def collect_finished_ids():
+                    nonlocal pending_ids
+                    pending_ids += ids.read()
+                    *finished, pending_ids = pending_ids.split('\n')
+                    for video_id in finished:
+                        if not video_id:
+                            continue
+                        downloaded_video_ids.append(video_id)
+                        if video_id in existing_srt:
+                            # Left over from an earlier, interrupted run
+                            self.logger.info(f"SRT subtitle already present for {video_id}")
+                            continue
+                        srt_needed.append(video_id)
+                        if pipelined:
+                            srt_tasks.append(asyncio.create_task(
+                                self._download_srt_for_video_async(video_id, semaphore)
+                            ))
+
+                # Stream output
+                async for lines in _read_output_lines(process.stdout):
+                    for line in lines:
+                        # Log important lines; progress updates are by far the
+                        # most common and fall through the [download] branch
+                        if line.startswith(b'[download]'):
+                            if line.startswith(b'[download] 100%') or b'Destination:' in line:
+                                self.logger.info(line.decode('utf-8', 'replace'))
+                        elif line.startswith((b'ERROR', b'WARNING')):
+                            self.logger.warning(line.decode('utf-8', 'replace'))
+                    collect_finished_ids()
+
+                # Wait for completion
+                return_code = await process.wait()
+                pending_ids += '\n'
+                collect_finished_ids()
+
+            new_downloads = len(downloaded_video_ids)
+
+            if return_code != 0:
+                if srt_tasks:
+                    await asyncio.gather(*srt_tasks)
+                self.logger.error(f"yt-dlp exited with code {return_code}")
+                return False
+
+            if new_downloads == 0:
+                self.logger.info("No new videos found in playlist")
+                return True
+
+            self.logger.info(f"Successfully downloaded {new_downloads} new video(s)")
+
+            # Blocking work goes to the default executor (asyncio.to_thread
+            # would need Python 3.9)
+            loop = asyncio.get_running_loop()
+
+            # Sync already-present subtitles to Google Drive while the
+            # remaining SRT subtitles are fetched
+            sync_task = None
+            if self.subtitle_syncer:
+                sync_task = loop.run_in_executor(None, self._sync_subtitles, download_started)
+
+            if pipelined:
+                results = await asyncio.gather(*srt_tasks)
+            elif srt_needed:
+                self.logger.info(f"Downloading SRT subtitles for {len(srt_needed)} video(s)...")
+                results = (await loop.run_in_executor(None, self._download_srt_batch, srt_needed)).values()
+            else:
+                results = []
+            srt_success_count = sum(results) + new_downloads - len(srt_needed)
+            self.logger.info(f"Downloaded {srt_success_count}/{new_downloads} SRT subtitle(s)")
+
+            # Second sync pass picks up the SRT files written above
+            if sync_task:
+                await sync_task
+                await loop.run_in_executor(None, self._sync_subtitles)
+            return True
+
+        finally:
+            try:
+                os.unlink(ids_file)
+            except OSError:
+                pass
+
     def get_playlist_info(self) -> Optional[Dict[str, Any]]:
         """
         Get information about the playlist without downloading.
 
+        Both the yt_dlp API and the CLI path return the playlist's first flat
+        entry, as printed by 'yt-dlp --dump-json --flat-playlist'; it carries
+        the playlist fields (playlist_title, playlist_id, ...) alongside the
+        video's own.
+
         Returns:
             Dictionary with playlist info or None if failed
         """
         try:
             playlist_url = self.config.get('playlist_url')
+
+            if self._ydl_info_opts is not None:
+                with yt_dlp.YoutubeDL(self._ydl_info_opts) as ydl:
+                    info = ydl.extract_info(playlist_url, download=False)
+                    entries = ydl.sanitize_info(info).get('entries') or []
+                    return entries[0] if entries else None
+
             # Build base cmd for info lookup and include cookies handling like the downloader
-            options = self.config.get('yt_dlp_options', {})
             cmd = [
                 'yt-dlp',
                 '--dump-json',
                 '--flat-playlist',
+                *self._cookie_args,
+                playlist_url,
             ]
 
-            cookies_browser = options.get('cookies_from_browser')
-            cookies_path = options.get('cookies_path') or options.get('cookies_from_browser_path')
-            if cookies_browser:
-                if cookies_path:
-                    cmd.extend(['--cookies-from-browser', f'{cookies_browser}:{cookies_path}'])
-                else:
-                    cmd.extend(['--cookies-from-browser', cookies_browser])
-            else:
-                default_chrome_path = str(Path.home() / 'Library' / 'Application Support' / 'Google' / 'Chrome')
-                cmd.extend(['--cookies-from-browser', f'chrome:{default_chrome_path}'])
-
-            cmd.append(playlist_url)
-
-            result = subprocess.run(
+            process = subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
             )
 
-            if result.returncode == 0:
-                # Parse the first line (playlist info)
-                lines = result.stdout.strip().split('\n')
-                if lines:
-                    return json.loads(lines[0])
+            # Only the first line (first entry) is needed, so stop yt-dlp
+            # as soon as it has been read instead of buffering every entry
+            timer = threading.Timer(30, process.kill)
+            timer.start()
+            try:
+                first_line = process.stdout.readline()
+            finally:
+                timer.cancel()
+                process.terminate()
+                process.wait(timeout=5)
+
+            first_line = first_line.strip()
+            if first_line:
+                return json.loads(first_line)
             return None
 
         except Exception as e:
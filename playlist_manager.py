@@ -4,11 +4,118 @@ Playlist Manager
 Handles playlist caching, queue management, and missing video detection.
 """
 
+import asyncio
 import json
 import logging
+import os
+import pickle
+import shutil
 import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from itertools import filterfalse
 from pathlib import Path
-from typing import List, Set, Optional
+from typing import Iterable, List, Set, Optional, Tuple
+
+# Compact the queue file once the removal journal holds more than this
+# fraction of the remaining queue
+_JOURNAL_COMPACT_RATIO = 0.1
+
+# Default cookie source: Chrome on macOS user's Library path
+_DEFAULT_CHROME_PROFILE = str(Path.home() / 'Library' / 'Application Support' / 'Google' / 'Chrome')
+
+
+def _file_key(path: Path) -> Optional[Tuple[int, int]]:
+    """
+    Return a (mtime_ns, size) key identifying the current contents of a file.
+
+    Args:
+        path: File to stat
+
+    Returns:
+        The key, or None if the file does not exist
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _atomic_write_lines(path: Path, lines: Iterable[str]):
+    """
+    Write lines to a file atomically with a single buffered write.
+
+    The data goes to a temporary sibling file that is fsynced and then
+    renamed over the target, so readers never see a partially written file.
+
+    Args:
+        path: File to write
+        lines: Lines to write (without newlines)
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb', buffering=1 << 16) as f:
+        f.write(('\n'.join(lines) + '\n').encode('ascii'))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _split_ids(text: str) -> List[str]:
+    """
+    Split newline-separated video IDs, dropping blank lines.
+
+    IDs never contain whitespace, so a plain split is enough; interning lets
+    the cache, archive and queue share one string per ID.
+
+    Args:
+        text: File contents
+
+    Returns:
+        List of video IDs
+    """
+    if not text:
+        return []
+    return list(map(sys.intern, filter(None, text.split('\n'))))
+
+
+def _parse_archive(data: bytes) -> Set[str]:
+    """
+    Parse download archive contents into a set of video IDs.
+
+    Lines are "youtube VIDEO_ID" or just "VIDEO_ID"; the ID is the tail after
+    the last space (the whole line if there is none).
+
+    Args:
+        data: Raw archive file contents
+
+    Returns:
+        Set of downloaded video IDs
+    """
+    if not data:
+        return set()
+    lines = data.decode('ascii').split('\n')
+    downloaded = set(map(sys.intern, [line.rpartition(' ')[2] for line in lines]))
+    downloaded.discard('')
+    return downloaded
+
+
+def _missing_ids(cached: Iterable[str], downloaded: Set[str]) -> List[str]:
+    """
+    Return the cached IDs that are not downloaded, keeping playlist order.
+
+    Args:
+        cached: Video IDs in playlist order
+        downloaded: Set of downloaded video IDs
+
+    Returns:
+        List of missing video IDs
+    """
+    # filterfalse runs the membership test in C
+    return list(filterfalse(downloaded.__contains__, cached))
 
 
 class PlaylistManager:
@@ -22,7 +129,9 @@ class PlaylistManager:
         queue_file: str = ".download_queue.txt",
         cookies_browser: Optional[str] = None,
         cookies_path: Optional[str] = None,
-        extractor_args: Optional[str] = None
+        extractor_args: Optional[str] = None,
+        fetch_timeout: float = 600,
+        cache_max_age: float = 86400
     ):
         """
         Initialize the playlist manager.
@@ -35,18 +144,45 @@ class PlaylistManager:
             cookies_browser: Browser to extract cookies from
             cookies_path: Path to browser cookies
             extractor_args: yt-dlp extractor arguments
+            fetch_timeout: Maximum seconds to wait for a playlist fetch
+            cache_max_age: Seconds after which refreshes rebuild the playlist
+                cache from a full fetch (0 to rebuild only on request)
         """
         self.playlist_url = playlist_url
         self.cache_file = Path(cache_file)
         self.archive_file = Path(archive_file)
+        # Pickled archive set, tagged with the archive file key it was built from
+        self.archive_pickle_file = self.archive_file.with_suffix('.pkl')
         self.queue_file = Path(queue_file)
+        # Append-only journal of IDs removed since the queue file was written
+        self.removed_file = self.queue_file.with_name(
+            f"{self.queue_file.stem}_removed{self.queue_file.suffix}"
+        )
         self.cookies_browser = cookies_browser
         self.cookies_path = cookies_path
         self.extractor_args = extractor_args
+        self.fetch_timeout = fetch_timeout
+        self.cache_max_age = cache_max_age
         self.logger = logging.getLogger('PlaylistManager')
 
+        # The base command only depends on the arguments above
+        self._base_cmd = tuple(self._build_base_command())
+
+        # Parsed file contents, reused until the file's (mtime, size) changes
+        self._cache_list: Optional[List[str]] = None
+        self._cache_key: Optional[Tuple[int, int]] = None
+        self._archive_set: Optional[Set[str]] = None
+        self._archive_key: Optional[Tuple[int, int]] = None
+        self._queue: Optional[deque] = None
+        self._queue_key: Optional[Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]] = None
+        self._removed_count = 0
+        # Writers replace the queue deque (never mutate it in place) under this
+        # lock, so the scheduler's background refresher can extend the queue
+        # while the download job reads and removes from it
+        self._queue_lock = threading.RLock()
+
     def _build_base_command(self) -> List[str]:
-        """Build base yt-dlp command with authentication."""
+        """Build base yt-dlp command with authentication (called once from __init__)."""
         cmd = ['yt-dlp']
 
         # Add cookies
@@ -57,8 +193,7 @@ class PlaylistManager:
                 cmd.extend(['--cookies-from-browser', self.cookies_browser])
         else:
             # Default: use Chrome on macOS
-            default_chrome_path = str(Path.home() / 'Library' / 'Application Support' / 'Google' / 'Chrome')
-            cmd.extend(['--cookies-from-browser', f'chrome:{default_chrome_path}'])
+            cmd.extend(['--cookies-from-browser', f'chrome:{_DEFAULT_CHROME_PROFILE}'])
 
         # Add extractor arguments
         if self.extractor_args:
@@ -66,7 +201,109 @@ class PlaylistManager:
 
         return cmd
 
-    def fetch_playlist(self) -> List[str]:
+    async def _stream_ids(self, cmd: List[str]) -> Optional[List[str]]:
+        """
+        Run a yt-dlp command that prints one video ID per line and collect them.
+
+        Args:
+            cmd: Complete yt-dlp command to run
+
+        Returns:
+            List of video IDs, or None if the command failed or timed out
+        """
+        if threading.current_thread() is not threading.main_thread():
+            # Python 3.7's child watcher only serves event loops in the main
+            # thread, so the scheduler's refresher thread can't use asyncio
+            # subprocesses; stream the command from a worker thread instead
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self._stream_ids_blocking, cmd
+            )
+
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+
+        # Drain stderr alongside stdout so yt-dlp never blocks on it
+        stderr_task = asyncio.create_task(process.stderr.read())
+        video_ids = []
+
+        async def collect():
+            # Collect IDs as yt-dlp emits them
+            async for line in process.stdout:
+                video_id = line.rstrip().decode('ascii')
+                if video_id:
+                    video_ids.append(sys.intern(video_id))
+                    if len(video_ids) % 1000 == 0:
+                        self.logger.info("Fetched %d video IDs so far...", len(video_ids))
+            return await process.wait()
+
+        try:
+            return_code = await asyncio.wait_for(collect(), timeout=self.fetch_timeout)
+        except asyncio.TimeoutError:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+            await process.wait()
+            stderr_task.cancel()
+            self.logger.error("Playlist fetch timeout")
+            return None
+
+        stderr = await stderr_task
+        if return_code != 0:
+            self.logger.error("Failed to fetch playlist: %s", stderr.decode(errors='replace'))
+            return None
+        return video_ids
+
+    def _stream_ids_blocking(self, cmd: List[str]) -> Optional[List[str]]:
+        """
+        Blocking counterpart of _stream_ids, usable from any thread.
+
+        Args:
+            cmd: Complete yt-dlp command to run
+
+        Returns:
+            List of video IDs, or None if the command failed or timed out
+        """
+        # stderr goes to a temporary file so yt-dlp never blocks on it
+        with tempfile.TemporaryFile() as stderr_file:
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file)
+            timed_out = threading.Event()
+
+            def kill():
+                timed_out.set()
+                process.kill()
+
+            timer = threading.Timer(self.fetch_timeout, kill)
+            timer.start()
+            video_ids = []
+            try:
+                # Collect IDs as yt-dlp emits them
+                with process.stdout:
+                    for line in process.stdout:
+                        video_id = line.rstrip().decode('ascii')
+                        if video_id:
+                            video_ids.append(sys.intern(video_id))
+                            if len(video_ids) % 1000 == 0:
+                                self.logger.info("Fetched %d video IDs so far...", len(video_ids))
+                return_code = process.wait()
+            finally:
+                timer.cancel()
+
+            if timed_out.is_set():
+                self.logger.error("Playlist fetch timeout")
+                return None
+            if return_code != 0:
+                stderr_file.seek(0)
+                self.logger.error(
+                    "Failed to fetch playlist: %s", stderr_file.read().decode(errors='replace')
+                )
+                return None
+            return video_ids
+
+    async def fetch_playlist_async(self) -> List[str]:
         """
         Fetch the complete list of video IDs from the playlist.
 
@@ -74,37 +311,92 @@ class PlaylistManager:
             List of video IDs
         """
         try:
-            self.logger.info(f"Fetching playlist: {self.playlist_url}")
+            self.logger.info("Fetching playlist: %s", self.playlist_url)
 
-            cmd = self._build_base_command()
+            cmd = list(self._base_cmd)
             cmd.extend([
                 '--flat-playlist',
-                '--get-id',
+                '--print', 'id',
                 self.playlist_url
             ])
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-
-            if result.returncode == 0:
-                video_ids = [line.strip() for line in result.stdout.strip().split('\n') if line.strip()]
-                self.logger.info(f"Found {len(video_ids)} videos in playlist")
-                return video_ids
-            else:
-                self.logger.error(f"Failed to fetch playlist: {result.stderr}")
+            video_ids = await self._stream_ids(cmd)
+            if video_ids is None:
                 return []
+            self.logger.info("Found %d videos in playlist", len(video_ids))
+            return video_ids
 
-        except subprocess.TimeoutExpired:
-            self.logger.error("Playlist fetch timeout")
-            return []
         except Exception as e:
-            self.logger.error(f"Error fetching playlist: {e}")
+            self.logger.error("Error fetching playlist: %s", e)
             return []
 
+    def fetch_playlist(self) -> List[str]:
+        """
+        Fetch the complete list of video IDs from the playlist.
+
+        Returns:
+            List of video IDs
+        """
+        return asyncio.run(self.fetch_playlist_async())
+
+    async def fetch_missing_directly_async(self) -> Optional[List[str]]:
+        """
+        Fetch only the playlist videos that are not yet in the download archive.
+
+        yt-dlp applies the archive filter itself, so the full playlist never
+        has to be cached or diffed in Python.
+
+        Returns:
+            List of missing video IDs in playlist order, or None on failure
+        """
+        try:
+            self.logger.info("Fetching missing videos from playlist: %s", self.playlist_url)
+
+            cmd = list(self._base_cmd)
+            cmd.extend([
+                '--flat-playlist',
+                '--print', 'id',
+                '--download-archive', str(self.archive_file),
+                '--lazy-playlist',
+                self.playlist_url
+            ])
+
+            missing = await self._stream_ids(cmd)
+            if missing is not None:
+                self.logger.info("Found %d missing videos in playlist", len(missing))
+            return missing
+
+        except Exception as e:
+            self.logger.error("Error fetching playlist: %s", e)
+            return None
+
+    def fetch_missing_directly(self) -> Optional[List[str]]:
+        """
+        Fetch only the playlist videos that are not yet in the download archive.
+
+        Returns:
+            List of missing video IDs in playlist order, or None on failure
+        """
+        return asyncio.run(self.fetch_missing_directly_async())
+
+    async def _fetch_playlist_with_archive(self) -> List[str]:
+        """
+        Fetch the playlist while the download archive is loaded in a worker thread.
+
+        The archive load is I/O-bound, so it overlaps with yt-dlp streaming IDs
+        and find_missing_videos() afterwards hits the warm archive cache.
+
+        Returns:
+            List of video IDs
+        """
+        # run_in_executor rather than asyncio.to_thread, which needs Python 3.9
+        loop = asyncio.get_running_loop()
+        video_ids, _ = await asyncio.gather(
+            self.fetch_playlist_async(),
+            loop.run_in_executor(None, self.load_download_archive)
+        )
+        return video_ids
+
     def save_playlist_cache(self, video_ids: List[str]) -> bool:
         """
         Save video IDs to cache file.
@@ -116,14 +408,34 @@ class PlaylistManager:
             True if successful
         """
         try:
-            with open(self.cache_file, 'w') as f:
-                f.write('\n'.join(video_ids) + '\n')
-            self.logger.info(f"Saved {len(video_ids)} video IDs to {self.cache_file}")
+            _atomic_write_lines(self.cache_file, video_ids)
+            self._cache_list, self._cache_key = list(video_ids), _file_key(self.cache_file)
+            self.logger.info("Saved %d video IDs to %s", len(video_ids), self.cache_file)
             return True
         except Exception as e:
-            self.logger.error(f"Failed to save playlist cache: {e}")
+            self.logger.error("Failed to save playlist cache: %s", e)
             return False
 
+    def _current_cache(self) -> List[str]:
+        """
+        Return the parsed playlist cache, re-reading the file only if it changed.
+
+        Returns:
+            The cached video IDs (shared; do not modify)
+        """
+        key = _file_key(self.cache_file)
+        if key is None:
+            self._cache_list, self._cache_key = None, None
+            self.logger.warning("Playlist cache not found: %s", self.cache_file)
+            return []
+        if key == self._cache_key:
+            return self._cache_list
+
+        video_ids = _split_ids(self.cache_file.read_text(encoding='ascii'))
+        self._cache_list, self._cache_key = video_ids, key
+        self.logger.info("Loaded %d video IDs from cache", len(video_ids))
+        return video_ids
+
     def load_playlist_cache(self) -> List[str]:
         """
         Load video IDs from cache file.
@@ -132,16 +444,9 @@ class PlaylistManager:
             List of cached video IDs
         """
         try:
-            if not self.cache_file.exists():
-                self.logger.warning(f"Playlist cache not found: {self.cache_file}")
-                return []
-
-            with open(self.cache_file, 'r') as f:
-                video_ids = [line.strip() for line in f if line.strip()]
-            self.logger.info(f"Loaded {len(video_ids)} video IDs from cache")
-            return video_ids
+            return list(self._current_cache())
         except Exception as e:
-            self.logger.error(f"Failed to load playlist cache: {e}")
+            self.logger.error("Failed to load playlist cache: %s", e)
             return []
 
     def load_download_archive(self) -> Set[str]:
@@ -149,29 +454,67 @@ class PlaylistManager:
         Load downloaded video IDs from archive file.
 
         Returns:
-            Set of downloaded video IDs
+            Set of downloaded video IDs (cached between calls; do not modify)
         """
         try:
-            if not self.archive_file.exists():
+            key = _file_key(self.archive_file)
+            if key is None:
+                self._archive_set, self._archive_key = None, None
                 self.logger.info("Download archive not found (no videos downloaded yet)")
                 return set()
+            if key == self._archive_key:
+                return self._archive_set
+
+            downloaded = self._load_archive_pickle(key)
+            if downloaded is None:
+                downloaded = _parse_archive(self.archive_file.read_bytes())
+                self._save_archive_pickle(key, downloaded)
 
-            downloaded = set()
-            with open(self.archive_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        # Format: "youtube VIDEO_ID" or just "VIDEO_ID"
-                        parts = line.split()
-                        video_id = parts[-1]  # Get the last part (video ID)
-                        downloaded.add(video_id)
-
-            self.logger.info(f"Loaded {len(downloaded)} downloaded video IDs from archive")
+            self._archive_set, self._archive_key = downloaded, key
+            self.logger.info("Loaded %d downloaded video IDs from archive", len(downloaded))
             return downloaded
         except Exception as e:
-            self.logger.error(f"Failed to load download archive: {e}")
+            self.logger.error("Failed to load download archive: %s", e)
             return set()
 
+    def _load_archive_pickle(self, key: Tuple[int, int]) -> Optional[Set[str]]:
+        """
+        Load the pickled archive set if it was built from the current archive file.
+
+        Args:
+            key: Current file key of the text archive
+
+        Returns:
+            Set of downloaded video IDs, or None if the pickle is missing or stale
+        """
+        try:
+            with open(self.archive_pickle_file, 'rb') as f:
+                pickled_key, downloaded = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning("Ignoring unreadable archive pickle %s: %s", self.archive_pickle_file, e)
+            return None
+        if pickled_key != key:
+            return None
+        return set(map(sys.intern, downloaded))
+
+    def _save_archive_pickle(self, key: Tuple[int, int], downloaded: Set[str]):
+        """
+        Atomically write the archive set and its source file key to the pickle file.
+
+        Args:
+            key: File key of the text archive the set was parsed from
+            downloaded: Set of downloaded video IDs
+        """
+        tmp_path = self.archive_pickle_file.with_name(self.archive_pickle_file.name + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((key, downloaded), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.archive_pickle_file)
+        except Exception as e:
+            self.logger.warning("Failed to save archive pickle: %s", e)
+
     def find_missing_videos(self) -> List[str]:
         """
         Find videos in playlist that haven't been downloaded.
@@ -186,10 +529,60 @@ class PlaylistManager:
             self.logger.warning("No cached playlist found. Run refresh_cache() first.")
             return []
 
-        missing = [vid for vid in cached_videos if vid not in downloaded_videos]
-        self.logger.info(f"Found {len(missing)} missing videos (out of {len(cached_videos)} total)")
+        missing = _missing_ids(cached_videos, downloaded_videos)
+        self.logger.info("Found %d missing videos (out of %d total)", len(missing), len(cached_videos))
         return missing
 
+    def _queue_files_key(self):
+        """Return the combined file key of the queue file and removal journal."""
+        return (_file_key(self.queue_file), _file_key(self.removed_file))
+
+    def _persist_queue(self):
+        """Atomically write the in-memory queue to the queue file and clear the journal."""
+        _atomic_write_lines(self.queue_file, self._queue)
+        try:
+            self.removed_file.unlink()
+        except FileNotFoundError:
+            pass
+        self._removed_count = 0
+        self._queue_key = self._queue_files_key()
+
+    def _maybe_compact(self):
+        """Rewrite the queue file once the removal journal has grown too large."""
+        if self._removed_count > len(self._queue) * _JOURNAL_COMPACT_RATIO:
+            self._persist_queue()
+
+    def _current_queue(self) -> deque:
+        """
+        Return the in-memory download queue, loading it from disk if needed.
+
+        The queue is read once and then kept in memory; it is only re-read if
+        the queue file or removal journal is changed by another process.
+
+        Returns:
+            The download queue
+        """
+        with self._queue_lock:
+            key = self._queue_files_key()
+            if self._queue is not None and key == self._queue_key:
+                return self._queue
+
+            queue_key, removed_key = key
+            removed = set()
+            if removed_key is not None:
+                removed = set(_split_ids(self.removed_file.read_text(encoding='ascii')))
+
+            if queue_key is None:
+                self.logger.info("Download queue not found")
+                self._queue = deque()
+            else:
+                video_ids = _split_ids(self.queue_file.read_text(encoding='ascii'))
+                self._queue = deque(filterfalse(removed.__contains__, video_ids))
+                self.logger.info("Loaded %d video IDs from download queue", len(self._queue))
+            self._removed_count = len(removed)
+            self._queue_key = key
+            return self._queue
+
     def save_download_queue(self, video_ids: List[str]) -> bool:
         """
         Save download queue to file.
@@ -200,14 +593,75 @@ class PlaylistManager:
         Returns:
             True if successful
         """
-        try:
-            with open(self.queue_file, 'w') as f:
-                f.write('\n'.join(video_ids) + '\n')
-            self.logger.info(f"Saved {len(video_ids)} video IDs to download queue")
-            return True
-        except Exception as e:
-            self.logger.error(f"Failed to save download queue: {e}")
-            return False
+        with self._queue_lock:
+            try:
+                self._queue = deque(video_ids)
+                self._persist_queue()
+                self.logger.info("Saved %d video IDs to download queue", len(video_ids))
+                return True
+            except Exception as e:
+                self._queue = None
+                self.logger.error("Failed to save download queue: %s", e)
+                return False
+
+    def extend_queue(self, video_ids: List[str]) -> int:
+        """
+        Append videos to the download queue, skipping queued or downloaded ones.
+
+        Args:
+            video_ids: Video IDs to add, in playlist order
+
+        Returns:
+            Number of videos added, or -1 on failure
+        """
+        with self._queue_lock:
+            try:
+                queue = self._current_queue()
+                skip = set(queue)
+                skip.update(self.load_download_archive())
+                new_ids = []
+                for vid in video_ids:
+                    if vid not in skip:
+                        skip.add(vid)
+                        new_ids.append(vid)
+                if new_ids:
+                    self._queue = queue + deque(new_ids)
+                    self._persist_queue()
+                    self.logger.info("Added %d video IDs to download queue", len(new_ids))
+                return len(new_ids)
+            except Exception as e:
+                self._queue = None
+                self.logger.error("Failed to extend download queue: %s", e)
+                return -1
+
+    def _copy_cache_to_queue(self, video_ids: List[str]) -> bool:
+        """
+        Use the playlist cache file as the download queue without re-encoding it.
+
+        Args:
+            video_ids: Contents of the cache file, kept as the in-memory queue
+
+        Returns:
+            True if successful
+        """
+        with self._queue_lock:
+            try:
+                tmp_path = self.queue_file.with_name(self.queue_file.name + '.tmp')
+                shutil.copyfile(self.cache_file, tmp_path)
+                os.replace(tmp_path, self.queue_file)
+                try:
+                    self.removed_file.unlink()
+                except FileNotFoundError:
+                    pass
+                self._queue = deque(video_ids)
+                self._removed_count = 0
+                self._queue_key = self._queue_files_key()
+                self.logger.info("Saved %d video IDs to download queue", len(video_ids))
+                return True
+            except Exception as e:
+                self._queue = None
+                self.logger.error("Failed to save download queue: %s", e)
+                return False
 
     def load_download_queue(self) -> List[str]:
         """
@@ -217,16 +671,9 @@ class PlaylistManager:
             List of video IDs to download
         """
         try:
-            if not self.queue_file.exists():
-                self.logger.info("Download queue not found")
-                return []
-
-            with open(self.queue_file, 'r') as f:
-                video_ids = [line.strip() for line in f if line.strip()]
-            self.logger.info(f"Loaded {len(video_ids)} video IDs from download queue")
-            return video_ids
+            return list(self._current_queue())
         except Exception as e:
-            self.logger.error(f"Failed to load download queue: {e}")
+            self.logger.error("Failed to load download queue: %s", e)
             return []
 
     def remove_from_queue(self, video_id: str) -> bool:
@@ -239,19 +686,26 @@ class PlaylistManager:
         Returns:
             True if successful
         """
-        try:
-            queue = self.load_download_queue()
-            if video_id in queue:
-                queue.remove(video_id)
-                self.save_download_queue(queue)
-                self.logger.info(f"Removed {video_id} from download queue ({len(queue)} remaining)")
-                return True
-            else:
-                self.logger.warning(f"Video {video_id} not found in queue")
+        with self._queue_lock:
+            try:
+                queue = self._current_queue()
+                if video_id in queue:
+                    # Drop every occurrence, matching how the journal is replayed on load
+                    self._queue = queue = deque(vid for vid in queue if vid != video_id)
+                    with open(self.removed_file, 'ab') as f:
+                        f.write(video_id.encode('ascii') + b'\n')
+                    self._removed_count += 1
+                    self._queue_key = self._queue_files_key()
+                    self._maybe_compact()
+                    self.logger.info("Removed %s from download queue (%d remaining)", video_id, len(queue))
+                    return True
+                else:
+                    self.logger.warning("Video %s not found in queue", video_id)
+                    return False
+            except Exception as e:
+                self._queue = None
+                self.logger.error("Failed to remove from queue: %s", e)
                 return False
-        except Exception as e:
-            self.logger.error(f"Failed to remove from queue: {e}")
-            return False
 
     def get_next_video(self) -> Optional[str]:
         """
@@ -260,40 +714,94 @@ class PlaylistManager:
         Returns:
             Video ID or None if queue is empty
         """
-        queue = self.load_download_queue()
+        try:
+            queue = self._current_queue()
+        except Exception as e:
+            self.logger.error("Failed to load download queue: %s", e)
+            return None
         return queue[0] if queue else None
 
-    def refresh_cache_and_queue(self) -> bool:
+    @property
+    def queue_length(self) -> int:
+        """
+        Number of videos in the download queue.
+
+        Read from the in-memory queue, so no file is touched once it is loaded.
+        """
+        queue = self._queue
+        if queue is None:
+            try:
+                queue = self._current_queue()
+            except Exception as e:
+                self.logger.error("Failed to load download queue: %s", e)
+                return 0
+        return len(queue)
+
+    def refresh_cache_and_queue(self, update_cache: bool = False) -> bool:
         """
         Refresh playlist cache and rebuild download queue.
 
+        By default only the missing videos are fetched (yt-dlp filters them
+        against the archive) and the playlist cache is left as is. The full
+        playlist is fetched and cached when requested or when no cache exists.
+
+        Args:
+            update_cache: Also fetch the full playlist and rewrite the cache
+
         Returns:
             True if successful
         """
         self.logger.info("=" * 60)
         self.logger.info("Refreshing playlist cache and download queue")
 
-        # Fetch playlist
-        video_ids = self.fetch_playlist()
-        if not video_ids:
-            self.logger.error("Failed to fetch playlist")
-            return False
+        if update_cache or self.cache_needs_refresh():
+            # Fetch playlist, loading the archive in parallel
+            video_ids = asyncio.run(self._fetch_playlist_with_archive())
+            if not video_ids:
+                self.logger.error("Failed to fetch playlist")
+                return False
 
-        # Save cache
-        if not self.save_playlist_cache(video_ids):
-            return False
+            # Save cache
+            if not self.save_playlist_cache(video_ids):
+                return False
+
+            # Find missing videos
+            missing = self.find_missing_videos()
+
+            # Save queue; when nothing is downloaded yet it is the cache file verbatim
+            if len(missing) == len(video_ids):
+                saved = self._copy_cache_to_queue(missing)
+            else:
+                saved = self.save_download_queue(missing)
+        else:
+            missing = self.fetch_missing_directly()
+            if missing is None:
+                self.logger.error("Failed to fetch playlist")
+                return False
 
-        # Find missing videos
-        missing = self.find_missing_videos()
+            # Save queue
+            saved = self.save_download_queue(missing)
 
-        # Save queue
-        if not self.save_download_queue(missing):
+        if not saved:
             return False
 
-        self.logger.info(f"Cache refresh complete: {len(missing)} videos queued for download")
+        self.logger.info("Cache refresh complete: %d videos queued for download", len(missing))
         self.logger.info("=" * 60)
         return True
 
+    def cache_needs_refresh(self) -> bool:
+        """
+        Check whether the playlist cache is missing or older than cache_max_age.
+
+        Returns:
+            True if the next refresh should fetch the full playlist
+        """
+        try:
+            mtime = os.stat(self.cache_file).st_mtime
+        except FileNotFoundError:
+            return True
+        return self.cache_max_age > 0 and time.time() - mtime >= self.cache_max_age
+
     def get_queue_status(self) -> dict:
         """
         Get current status of playlist and queue.
@@ -301,17 +809,27 @@ class PlaylistManager:
         Returns:
             Dictionary with status information
         """
-        cached = self.load_playlist_cache()
-        downloaded = self.load_download_archive()
-        queue = self.load_download_queue()
+        # The loaders stat each file once and reuse the parsed contents when
+        # unchanged; existence is read back from the keys they recorded.
+        try:
+            total_videos = len(self._current_cache())
+        except Exception as e:
+            self.logger.error("Failed to load playlist cache: %s", e)
+            total_videos = 0
+        downloaded = len(self.load_download_archive())
+        try:
+            pending = len(self._current_queue())
+        except Exception as e:
+            self.logger.error("Failed to load download queue: %s", e)
+            pending = 0
 
         return {
-            'total_videos': len(cached),
-            'downloaded': len(downloaded),
-            'pending': len(queue),
-            'cache_exists': self.cache_file.exists(),
-            'queue_exists': self.queue_file.exists(),
-            'archive_exists': self.archive_file.exists()
+            'total_videos': total_videos,
+            'downloaded': downloaded,
+            'pending': pending,
+            'cache_exists': self._cache_key is not None,
+            'queue_exists': self._queue_key is not None and self._queue_key[0] is not None,
+            'archive_exists': self._archive_key is not None
         }
 
 
@@ -333,7 +851,7 @@ def main():
     manager = PlaylistManager(playlist_url)
 
     # Refresh cache and queue
-    if manager.refresh_cache_and_queue():
+    if manager.refresh_cache_and_queue(update_cache=True):
         # Show status
         status = manager.get_queue_status()
         print("\nPlaylist Status:")
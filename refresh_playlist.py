@@ -55,7 +55,7 @@ def main():
 
         # Refresh cache and queue
         print("Refreshing playlist cache...")
-        if downloader.playlist_manager.refresh_cache_and_queue():
+        if downloader.playlist_manager.refresh_cache_and_queue(update_cache=True):
             print()
             print("✓ Cache refresh successful!")
             print()
@@ -10,9 +10,8 @@ import sys
 import logging
 from datetime import datetime
 from pathlib import Path
-from threading import Lock
-
-import schedule
+from typing import Optional
+from threading import Event, Lock, Thread
 
 from downloader import PlaylistDownloader
 
@@ -29,7 +28,7 @@ class DownloadScheduler:
         """
         self.config_path = config_path
         self.downloader = PlaylistDownloader(config_path)
-        self.running = True
+        self._stop_event = Event()  # Set by the signal handler to stop the loop
         self.check_count = 0
         self.download_lock = Lock()  # Prevent concurrent downloads
         self.is_downloading = False
@@ -37,6 +36,9 @@ class DownloadScheduler:
         self.last_download_time = 0  # Track when last download occurred
         self.videos_downloaded = 0  # Count successful downloads
         self.rate_limit_skips = 0  # Count checks skipped due to rate limit
+        self._refresh_requested = Event()  # Wakes the background refresher
+        self._refresher_thread: Optional[Thread] = None
+        self._prefetched_for: Optional[str] = None  # Last video a prefetch was requested for
 
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -46,8 +48,9 @@ class DownloadScheduler:
 
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully."""
-        self.logger.info(f"\nReceived signal {signum}. Shutting down gracefully...")
-        self.running = False
+        self.logger.info("\nReceived signal %d. Shutting down gracefully...", signum)
+        self._stop_event.set()
+        self._refresh_requested.set()
 
     def _check_rate_limit(self) -> bool:
         """
@@ -74,86 +77,123 @@ class DownloadScheduler:
             minutes = int((time_remaining % 3600) // 60)
             seconds = int(time_remaining % 60)
             self.logger.info(
-                f"Rate limit: Next download available in {hours:02d}:{minutes:02d}:{seconds:02d}"
+                "Rate limit: Next download available in %02d:%02d:%02d", hours, minutes, seconds
             )
             return False
 
+    def _request_refresh(self):
+        """Ask the background refresher to look for new videos."""
+        self._refresh_requested.set()
+
+    def _refresh_queue(self):
+        """Fetch missing videos and add them to the download queue."""
+        pm = self.downloader.playlist_manager
+        logger = self.logger
+
+        if pm.cache_needs_refresh():
+            # First run, or the cache is old enough that the playlist total
+            # would drift: rebuild the playlist cache and queue from scratch
+            if not pm.refresh_cache_and_queue(update_cache=True):
+                logger.error("Failed to refresh playlist cache")
+                return
+            added = pm.queue_length
+        else:
+            missing = pm.fetch_missing_directly()
+            added = pm.extend_queue(missing) if missing is not None else -1
+            if added < 0:
+                logger.error("Failed to refresh playlist cache")
+                return
+
+        if added:
+            logger.info("Found %d new video(s) in playlist", added)
+        elif not pm.queue_length:
+            logger.info("No new videos found in playlist. All caught up!")
+            status = pm.get_queue_status()
+            logger.info("Status: %d/%d videos downloaded", status['downloaded'], status['total_videos'])
+
+    def _refresher_loop(self):
+        """Refresh the download queue whenever a refresh is requested."""
+        while True:
+            self._refresh_requested.wait()
+            if self._stop_event.is_set():
+                break
+            self._refresh_requested.clear()
+            try:
+                self._refresh_queue()
+            except Exception as e:
+                self.logger.error("Error refreshing download queue: %s", e, exc_info=True)
+
     def download_job(self):
         """Job function that gets executed on schedule."""
         self.check_count += 1
+        logger = self.logger
 
         # Try to acquire the lock without blocking
         if not self.download_lock.acquire(blocking=False):
             self.skipped_checks += 1
-            self.logger.warning(
-                f"Check #{self.check_count} - SKIPPED (previous download still in progress) "
-                f"- Total skipped: {self.skipped_checks}"
+            logger.warning(
+                "Check #%d - SKIPPED (previous download still in progress) - Total skipped: %d",
+                self.check_count, self.skipped_checks
             )
             return
 
         try:
             self.is_downloading = True
             start_time = time.time()
-            self.logger.info(
-                f"Check #{self.check_count} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            logger.info(
+                "Check #%d - %s", self.check_count, datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             )
 
             # Check rate limit
             if not self._check_rate_limit():
                 self.rate_limit_skips += 1
-                self.logger.info(f"Check #{self.check_count} - SKIPPED (rate limit)")
+                logger.info("Check #%d - SKIPPED (rate limit)", self.check_count)
                 return
 
             # Check if playlist manager is available
-            if not self.downloader.playlist_manager:
-                self.logger.error("Playlist manager not initialized. Using legacy download mode.")
-                self.downloader.download()
+            downloader = self.downloader
+            pm = downloader.playlist_manager
+            if not pm:
+                logger.error("Playlist manager not initialized. Using legacy download mode.")
+                downloader.download()
                 duration = time.time() - start_time
-                self.logger.info(f"Check completed in {duration:.1f} seconds")
+                logger.info("Check completed in %.1f seconds", duration)
                 return
 
             # Get next video from queue
-            next_video = self.downloader.playlist_manager.get_next_video()
+            next_video = pm.get_next_video()
 
             if not next_video:
-                self.logger.info("Download queue is empty. Checking for new videos...")
-
-                # Refresh cache and queue to detect new videos
-                if self.downloader.playlist_manager.refresh_cache_and_queue():
-                    next_video = self.downloader.playlist_manager.get_next_video()
-
-                    if not next_video:
-                        self.logger.info("No new videos found in playlist. All caught up!")
-                        status = self.downloader.playlist_manager.get_queue_status()
-                        self.logger.info(
-                            f"Status: {status['downloaded']}/{status['total_videos']} videos downloaded"
-                        )
-                    else:
-                        queue = self.downloader.playlist_manager.load_download_queue()
-                        self.logger.info(f"Found {len(queue)} new video(s) in playlist")
-                else:
-                    self.logger.error("Failed to refresh playlist cache")
-                    return
+                # Detect new videos in the background; they are picked up on a later check
+                logger.info("Download queue is empty. Checking for new videos...")
+                self._request_refresh()
 
             # Download single video if available
             if next_video:
-                queue_length = len(self.downloader.playlist_manager.load_download_queue())
-                self.logger.info(f"Downloading video {next_video} ({queue_length} remaining in queue)")
+                queue_length = pm.queue_length
+                logger.info("Downloading video %s (%d remaining in queue)", next_video, queue_length)
+
+                # Fetch the next batch while the last queued video downloads,
+                # once per video so one that keeps failing doesn't trigger a
+                # playlist fetch on every check
+                if queue_length == 1 and next_video != self._prefetched_for:
+                    self._prefetched_for = next_video
+                    self._request_refresh()
 
-                if self.downloader.download_single_video(next_video):
+                if downloader.download_single_video(next_video):
                     # Remove from queue on success
-                    self.downloader.playlist_manager.remove_from_queue(next_video)
+                    pm.remove_from_queue(next_video)
                     self.last_download_time = time.time()
                     self.videos_downloaded += 1
-                    self.logger.info(f"Total videos downloaded this session: {self.videos_downloaded}")
+                    logger.info("Total videos downloaded this session: %d", self.videos_downloaded)
                 else:
-                    self.logger.error(f"Failed to download video {next_video}. Will retry on next check.")
+                    logger.error("Failed to download video %s. Will retry on next check.", next_video)
 
             duration = time.time() - start_time
-            self.logger.info(f"Check completed in {duration:.1f} seconds")
+            logger.info("Check completed in %.1f seconds", duration)
 
         except Exception as e:
-            self.logger.error(f"Error in download job: {e}", exc_info=True)
+            logger.error("Error in download job: %s", e, exc_info=True)
         finally:
             self.is_downloading = False
             self.download_lock.release()
@@ -163,19 +203,19 @@ class DownloadScheduler:
         self.logger.info("=" * 70)
         self.logger.info("YouTube Playlist Auto-Downloader - Scheduler Started")
         self.logger.info("=" * 70)
-        self.logger.info(f"Monitoring playlist: {self.downloader.config.get('playlist_url')}")
-        self.logger.info(f"Download path: {Path(self.downloader.config.get('download_path')).absolute()}")
-        self.logger.info(f"Check interval: {self.downloader.config.get('check_interval_seconds', 60)} seconds")
+        self.logger.info("Monitoring playlist: %s", self.downloader.config.get('playlist_url'))
+        self.logger.info("Download path: %s", Path(self.downloader.config.get('download_path')).absolute())
+        self.logger.info("Check interval: %s seconds", self.downloader.config.get('check_interval_seconds', 60))
 
         download_interval_hours = self.downloader.config.get('download_interval_hours', 1)
         if download_interval_hours == 0:
             self.logger.info("Rate limiting: DISABLED (downloads as fast as possible)")
         else:
-            self.logger.info(f"Rate limiting: 1 video every {download_interval_hours} hour(s)")
+            self.logger.info("Rate limiting: 1 video every %s hour(s)", download_interval_hours)
 
-        self.logger.info(f"Archive file: {self.downloader.config.get('archive_file')}")
-        self.logger.info(f"Queue file: {self.downloader.config.get('download_queue_file', '.download_queue.txt')}")
-        self.logger.info(f"Cache file: {self.downloader.config.get('playlist_cache_file', '.playlist_cache.txt')}")
+        self.logger.info("Archive file: %s", self.downloader.config.get('archive_file'))
+        self.logger.info("Queue file: %s", self.downloader.config.get('download_queue_file', '.download_queue.txt'))
+        self.logger.info("Cache file: %s", self.downloader.config.get('playlist_cache_file', '.playlist_cache.txt'))
         self.logger.info("=" * 70)
         self.logger.info("Press Ctrl+C to stop")
         self.logger.info("")
@@ -183,29 +223,39 @@ class DownloadScheduler:
         # Get check interval from config
         check_interval = self.downloader.config.get('check_interval_seconds', 60)
 
-        # Schedule the download job
-        schedule.every(check_interval).seconds.do(self.download_job)
+        # Refresh the download queue on a background thread so playlist
+        # fetches overlap with downloads instead of delaying a check
+        if self.downloader.playlist_manager:
+            self._refresher_thread = Thread(target=self._refresher_loop, daemon=True)
+            self._refresher_thread.start()
 
         # Run the first check immediately
         self.logger.info("Running initial check...")
         self.download_job()
+        next_run = time.monotonic() + check_interval
 
-        # Main scheduler loop
-        while self.running:
+        # Main scheduler loop: sleep until the next check is due; a shutdown
+        # signal sets the stop event and wakes the wait immediately
+        while not self._stop_event.is_set():
             try:
-                schedule.run_pending()
-                time.sleep(1)
+                now = time.monotonic()
+                if now >= next_run:
+                    self.download_job()
+                    next_run += check_interval
+                    if next_run < now:
+                        next_run = now + check_interval
+                self._stop_event.wait(max(0.0, next_run - time.monotonic()))
             except Exception as e:
-                self.logger.error(f"Error in scheduler loop: {e}", exc_info=True)
-                time.sleep(5)  # Wait a bit before retrying
+                self.logger.error("Error in scheduler loop: %s", e, exc_info=True)
+                self._stop_event.wait(5)  # Wait a bit before retrying
 
         self.logger.info("Scheduler stopped.")
-        self.logger.info(f"Total checks performed: {self.check_count}")
+        self.logger.info("Total checks performed: %d", self.check_count)
         if self.skipped_checks > 0:
-            self.logger.info(f"Checks skipped due to long downloads: {self.skipped_checks}")
+            self.logger.info("Checks skipped due to long downloads: %d", self.skipped_checks)
         if self.rate_limit_skips > 0:
-            self.logger.info(f"Checks skipped due to rate limiting: {self.rate_limit_skips}")
-        self.logger.info(f"Videos downloaded this session: {self.videos_downloaded}")
+            self.logger.info("Checks skipped due to rate limiting: %d", self.rate_limit_skips)
+        self.logger.info("Videos downloaded this session: %d", self.videos_downloaded)
 
 
 def main():
@@ -5,15 +5,278 @@ Automatically syncs downloaded subtitle files to Google Drive sync folder.
 """
 
 import os
-import shutil
+import sys
 import logging
+import queue
+import tempfile
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Set, List, Tuple
+from typing import Dict, FrozenSet, Iterable, Set, List, Tuple, Optional, Union
+
+# Buffer size for the userspace copy fallback
+_COPY_BUFFER_SIZE = 1 << 20
+
+# Maximum number of subtitle copies in flight at once
+_COPY_WORKERS = 8
+
+# Maximum number of files copied per submitted task
+_COPY_BATCH_SIZE = 64
+
+# Archive appends are coalesced for up to this many seconds or names per write
+_ARCHIVE_FLUSH_WINDOW = 0.05
+_ARCHIVE_FLUSH_BATCH = 100
+
+# Queued after the last archive entry to stop the writer thread
+_ARCHIVE_STOP = object()
+
+# Keep Windows from translating newlines on raw file descriptors
+_O_BINARY = getattr(os, 'O_BINARY', 0)
+
+# Parsed sync archives shared across instances: path -> (mtime_ns, size, names)
+_ARCHIVE_CACHE: Dict[str, Tuple[int, int, FrozenSet[str]]] = {}
+
+
+def _kernel_copy(fd_in: int, fd_out: int, remaining: int) -> int:
+    """
+    Copy bytes between file descriptors without passing them through Python.
+
+    Tries copy_file_range, then (on Linux) sendfile; either may be unsupported
+    for the platform or filesystem pair, in which case the next one picks up
+    from the current file offsets.
+
+    Args:
+        fd_in: Source file descriptor
+        fd_out: Destination file descriptor
+        remaining: Number of bytes left to copy
+
+    Returns:
+        Number of bytes that could not be copied in-kernel
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(fd_in, fd_out, remaining)
+                if copied == 0:
+                    return 0
+                remaining -= copied
+            return 0
+        except OSError:
+            pass
+
+    # Only Linux sendfile writes to regular files; macOS and the BSDs need a
+    # socket as the destination and an explicit offset
+    if sys.platform.startswith('linux') and hasattr(os, 'sendfile'):
+        try:
+            while remaining > 0:
+                copied = os.sendfile(fd_out, fd_in, None, remaining)
+                if copied == 0:
+                    return 0
+                remaining -= copied
+            return 0
+        except (OSError, TypeError):
+            pass
+
+    return remaining
+
+
+def _fast_copy(src: Union[str, Path], dst: Union[str, Path]):
+    """
+    Copy file contents from src to dst, keeping the data in-kernel when possible.
+
+    No metadata is copied; the destination is a plain 0644 file with the
+    source's bytes and the copy time as its mtime.
+
+    Args:
+        src: Source file path
+        dst: Destination file path (created or truncated)
+    """
+    fd_in = os.open(src, os.O_RDONLY | _O_BINARY)
+    try:
+        fd_out = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o644)
+        try:
+            if _kernel_copy(fd_in, fd_out, os.fstat(fd_in).st_size) == 0:
+                return
+
+            # Userspace fallback with a large reusable buffer
+            buf = bytearray(_COPY_BUFFER_SIZE)
+            view = memoryview(buf)
+            with open(fd_in, 'rb', buffering=0, closefd=False) as f:
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    written = 0
+                    while written < n:
+                        written += os.write(fd_out, view[written:n])
+        finally:
+            os.close(fd_out)
+    finally:
+        os.close(fd_in)
+
+
+def _copy_batch(jobs: List[Tuple[str, str]]) -> List[Optional[Exception]]:
+    """
+    Copy a batch of files, collecting per-file errors instead of raising.
+
+    Args:
+        jobs: (source, destination) path pairs
+
+    Returns:
+        One entry per job: None on success, otherwise the exception raised
+    """
+    errors = []
+    for src, dst in jobs:
+        try:
+            _fast_copy(src, dst)
+            errors.append(None)
+        except Exception as e:
+            errors.append(e)
+    return errors
+
+
+class _ArchiveWriter:
+    """
+    Appends sync archive entries from a background thread, one write per burst.
+
+    The thread is started by the first put() and stopped by close(); the
+    append descriptor stays open between writes. The writer holds no
+    reference to its SubtitleSyncer, so a dropped syncer can still be
+    collected (its finalizer closes the writer).
+    """
+
+    def __init__(self, archive_file: Path, logger: logging.Logger):
+        """
+        Initialize the writer.
+
+        Args:
+            archive_file: Path to the sync archive file
+            logger: Logger for write failures
+        """
+        self.archive_file = archive_file
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    def put(self, name: str):
+        """
+        Queue a synced file name for appending to the archive.
+
+        Args:
+            name: Synced subtitle file name
+        """
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='SubtitleArchiveWriter', daemon=True
+                )
+                self._thread.start()
+        self._queue.put(name)
+
+    def _run(self):
+        """Append queued names to the archive until the stop marker arrives."""
+        archive_queue = self._queue
+        stop = False
+        while not stop:
+            names = []
+            item = archive_queue.get()
+            deadline = time.monotonic() + _ARCHIVE_FLUSH_WINDOW
+            while True:
+                if item is _ARCHIVE_STOP:
+                    stop = True
+                    archive_queue.task_done()
+                    break
+                names.append(item)
+                timeout = deadline - time.monotonic()
+                if len(names) >= _ARCHIVE_FLUSH_BATCH or timeout <= 0:
+                    break
+                try:
+                    item = archive_queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+
+            if not names:
+                continue
+            try:
+                self._write(names)
+            except Exception as e:
+                # The names stay in synced_files and are written by the next full save
+                self.logger.error("Failed to update sync archive: %s", e)
+            finally:
+                for _ in names:
+                    archive_queue.task_done()
+
+    def _write(self, names: Iterable[str]):
+        """
+        Append names to the archive in one write.
+
+        Duplicate lines are harmless since the archive is loaded into a set.
+
+        Args:
+            names: Synced subtitle file names
+        """
+        data = "".join(f"{name}\n" for name in names).encode('utf-8')
+        with self._lock:
+            if self._fd is None:
+                self._fd = os.open(
+                    self.archive_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND | _O_BINARY, 0o644
+                )
+            view = memoryview(data)
+            while view:
+                view = view[os.write(self._fd, view):]
+
+    def _close_fd(self, sync: bool = False):
+        """
+        Close the append descriptor if open. Caller holds _lock.
+
+        Args:
+            sync: fsync the archive before closing
+        """
+        if self._fd is not None:
+            try:
+                if sync:
+                    os.fsync(self._fd)
+            finally:
+                os.close(self._fd)
+                self._fd = None
+
+    def replace(self, staged_path: str):
+        """
+        Rename a fully written archive over the current one.
+
+        Args:
+            staged_path: Path of the staging file to move into place
+        """
+        with self._lock:
+            os.replace(staged_path, self.archive_file)
+            # The open append descriptor still points at the replaced file
+            self._close_fd()
+
+    def flush(self):
+        """Wait until every queued entry has been written."""
+        self._queue.join()
+
+    def close(self):
+        """Write queued entries, stop the thread and sync and close the archive."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_ARCHIVE_STOP)
+            thread.join()
+        with self._lock:
+            self._close_fd(sync=True)
 
 
 class SubtitleSyncer:
     """Handles syncing of subtitle files to Google Drive folder."""
 
+    # Resolved paths shared across instances, keyed by (cwd, raw path, expanduser)
+    _resolve_cache: Dict[Tuple[str, str, bool], Path] = {}
+
     def __init__(self, sync_folder: str, archive_file: str, download_path: str):
         """
         Initialize the SubtitleSyncer.
@@ -23,82 +286,216 @@ class SubtitleSyncer:
             archive_file: Path to sync archive file that tracks synced files
             download_path: Path to downloads directory
         """
-        self.sync_folder = Path(sync_folder).expanduser().resolve()
-        self.archive_file = Path(archive_file).resolve()
-        self.download_path = Path(download_path).resolve()
+        self.sync_folder = self._resolve_path(sync_folder, expand_user=True)
+        self.archive_file = self._resolve_path(archive_file)
+        self.download_path = self._resolve_path(download_path)
         self.logger = logging.getLogger('SubtitleSyncer')
+        # String form for building destination paths without Path objects
+        self._sync_folder_str = str(self.sync_folder)
 
         # Ensure sync folder exists
-        self.sync_folder.mkdir(parents=True, exist_ok=True)
+        if not os.path.isdir(self._sync_folder_str):
+            self.sync_folder.mkdir(parents=True, exist_ok=True)
 
         # Load sync archive
         self.synced_files = self._load_archive()
 
+        # Names synced one at a time are appended to the archive by a
+        # background thread so callers don't wait on the archive write. The
+        # finalizer closes it when the syncer is collected or at exit.
+        self._archive_writer = _ArchiveWriter(self.archive_file, self.logger)
+        self._finalizer = weakref.finalize(self, self._archive_writer.close)
+
+    @classmethod
+    def _resolve_path(cls, raw: str, expand_user: bool = False) -> Path:
+        """
+        Resolve a configured path, reusing the result for repeated instances.
+
+        Args:
+            raw: Path as given in the configuration
+            expand_user: Expand a leading ~ before resolving
+
+        Returns:
+            Absolute resolved path
+        """
+        key = (os.getcwd(), str(raw), expand_user)
+        resolved = cls._resolve_cache.get(key)
+        if resolved is None:
+            path = Path(raw)
+            if expand_user:
+                path = path.expanduser()
+            resolved = cls._resolve_cache[key] = path.resolve()
+        return resolved
+
     def _load_archive(self) -> Set[str]:
         """Load the set of already synced files from archive."""
-        if not self.archive_file.exists():
+        path = str(self.archive_file)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return set()
+
+        # Reuse the parsed archive while the file is unchanged
+        cached = _ARCHIVE_CACHE.get(path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return set(cached[2])
+
+        try:
+            data = self.archive_file.read_bytes()
+        except FileNotFoundError:
             return set()
 
-        with open(self.archive_file, 'r', encoding='utf-8') as f:
-            return set(line.strip() for line in f if line.strip())
+        # One read and one split; splitlines also drops Windows line endings
+        synced = set(data.decode('utf-8').splitlines())
+        synced.discard('')
+        _ARCHIVE_CACHE[path] = (st.st_mtime_ns, st.st_size, frozenset(synced))
+        return synced
 
     def _save_archive(self):
-        """Save the current set of synced files to archive."""
-        with open(self.archive_file, 'w', encoding='utf-8') as f:
-            for filename in sorted(self.synced_files):
-                f.write(f"{filename}\n")
+        """Save the current set of synced files to archive, compacting appended entries."""
+        # Order doesn't matter since the archive is loaded into a set. Write a
+        # uniquely named staging file, fsync it and rename it over the archive,
+        # so neither a crash nor a power loss leaves a truncated or empty
+        # archive (which would force a full re-sync), and two processes saving
+        # at once never share a staging file.
+        data = "\n".join(self.synced_files)
+        directory, name = os.path.split(str(self.archive_file))
+        fd, tmp_path = tempfile.mkstemp(prefix=name + '.', suffix='.tmp', dir=directory)
+        try:
+            with open(fd, 'w', encoding='utf-8') as f:
+                if data:
+                    f.write(data)
+                    f.write("\n")
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp creates the file owner-only; keep the archive's usual mode
+            os.chmod(tmp_path, 0o644)
+            self._archive_writer.replace(tmp_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def flush(self):
+        """Wait until every queued archive entry has been written."""
+        self._archive_writer.flush()
 
-    def _find_subtitle_files(self) -> List[Path]:
+    def close(self):
+        """Write queued archive entries, stop the writer thread and close the archive."""
+        self._finalizer()
+
+    def _find_subtitle_files(self) -> List[str]:
         """
         Find all subtitle (.srt) files in the download directory.
 
         Returns:
-            List of Path objects for subtitle files
+            List of subtitle file paths
         """
         subtitle_files = []
 
         if not self.download_path.exists():
-            self.logger.warning(f"Download path does not exist: {self.download_path}")
+            self.logger.warning("Download path does not exist: %s", self.download_path)
             return subtitle_files
 
-        # Search for .srt files recursively
-        for srt_file in self.download_path.rglob("*.srt"):
-            if srt_file.is_file():
-                subtitle_files.append(srt_file)
+        # Search for .srt files recursively; scandir entries carry the file
+        # type from the directory listing, so no extra stat per entry. Hidden
+        # directories (caches and the like) never hold downloads and are skipped.
+        stack = [str(self.download_path)]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not entry.name.startswith('.'):
+                                stack.append(entry.path)
+                        elif entry.name.endswith('.srt') and entry.is_file():
+                            subtitle_files.append(entry.path)
+            except OSError as e:
+                self.logger.warning("Cannot scan %s: %s", directory, e)
 
         return subtitle_files
 
-    def _should_sync_file(self, source_file: Path, dest_file: Path) -> bool:
+    def _list_sync_folder(self) -> Set[str]:
+        """
+        Snapshot the names of the files currently in the sync folder.
+
+        Returns:
+            Set of file names
+        """
+        try:
+            with os.scandir(self.sync_folder) as entries:
+                return {entry.name for entry in entries}
+        except FileNotFoundError:
+            return set()
+
+    def _should_sync_file(
+        self,
+        source_file: Union[str, Path],
+        dest_name: str,
+        existing_dests: Optional[Set[str]] = None
+    ) -> bool:
         """
         Determine if a file should be synced.
 
+        A source missing from the archive whose destination already holds a
+        copy of it (same size, written no earlier than the source) is recorded
+        as synced without copying again.
+
         Args:
             source_file: Source subtitle file path
-            dest_file: Destination file path in sync folder
+            dest_name: Destination file name in sync folder
+            existing_dests: Snapshot of the sync folder's file names; if not
+                given, the destination is checked on disk
 
         Returns:
             True if file should be synced, False otherwise
         """
+        source_name = os.path.basename(source_file)
+        dest_file = os.path.join(self._sync_folder_str, dest_name)
+        if existing_dests is not None:
+            dest_exists = dest_name in existing_dests
+        else:
+            dest_exists = os.path.exists(dest_file)
+
         # Check if already in archive
-        if source_file.name in self.synced_files:
+        if source_name in self.synced_files:
             # Verify destination file still exists
-            if dest_file.exists():
+            if dest_exists:
                 return False
             else:
                 # Destination was deleted, resync
-                self.logger.info(f"Destination file missing, will resync: {source_file.name}")
-                self.synced_files.discard(source_file.name)
+                self.logger.info("Destination file missing, will resync: %s", source_name)
+                self.synced_files.discard(source_name)
+        elif dest_exists:
+            # Archive lost track of an existing copy; copies carry no source
+            # metadata, so an up-to-date one is at least as new as its source
+            src_st = os.stat(source_file)
+            dst_st = os.stat(dest_file)
+            if src_st.st_size == dst_st.st_size and dst_st.st_mtime >= src_st.st_mtime:
+                self.logger.info("Already in sync folder, recording as synced: %s", source_name)
+                self.synced_files.add(source_name)
+                return False
 
         return True
 
-    def sync_subtitles(self) -> Tuple[int, int]:
+    def sync_subtitles(self, modified_before: Optional[float] = None) -> Tuple[int, int]:
         """
         Sync all subtitle files to Google Drive folder.
 
+        Args:
+            modified_before: If given, only sync files last modified before this
+                timestamp, leaving files that may still be being written for a
+                later pass
+
         Returns:
             Tuple of (synced_count, skipped_count)
         """
         subtitle_files = self._find_subtitle_files()
+        if modified_before is not None:
+            subtitle_files = [f for f in subtitle_files if os.stat(f).st_mtime < modified_before]
 
         if not subtitle_files:
             self.logger.info("No subtitle files found to sync")
@@ -106,73 +503,123 @@ class SubtitleSyncer:
 
         synced_count = 0
         skipped_count = 0
-
-        for source_file in subtitle_files:
-            # Change extension from .srt to .txt
-            dest_filename = source_file.stem + '.txt'
-            dest_file = self.sync_folder / dest_filename
+        existing_dests = self._list_sync_folder()
+        archived_count = len(self.synced_files)
+
+        # Pick the files to copy, keyed by destination so two sources with
+        # the same name never write one destination concurrently
+        pending = {}
+        sync_folder = self._sync_folder_str
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        synced_files = self.synced_files
+        should_sync = self._should_sync_file
+
+        # Build every source and destination name up front (.srt -> .txt)
+        basename = os.path.basename
+        source_names = [basename(f) for f in subtitle_files]
+        dest_filenames = [name[:-4] + '.txt' for name in source_names]
+
+        for source_file, source_name, dest_filename in zip(subtitle_files, source_names, dest_filenames):
+            # Common case on repeat runs: archived and still in the sync folder.
+            # Settle it with two set lookups instead of a method call.
+            if source_name in synced_files and dest_filename in existing_dests:
+                if debug:
+                    self.logger.debug("Skipped (already synced): %s", source_name)
+                skipped_count += 1
+                continue
 
             try:
-                if self._should_sync_file(source_file, dest_file):
-                    # Copy file to sync folder with .txt extension
-                    shutil.copy2(source_file, dest_file)
-                    self.logger.info(f"Synced subtitle: {source_file.name} -> {dest_filename}")
-
-                    # Add to archive
-                    self.synced_files.add(source_file.name)
-                    synced_count += 1
+                if should_sync(source_file, dest_filename, existing_dests):
+                    pending[dest_filename] = (source_file, source_name)
                 else:
-                    self.logger.debug(f"Skipped (already synced): {source_file.name}")
+                    if debug:
+                        self.logger.debug("Skipped (already synced): %s", source_name)
                     skipped_count += 1
 
             except Exception as e:
-                self.logger.error(f"Failed to sync {source_file.name}: {e}")
+                self.logger.error("Failed to sync %s: %s", source_name, e)
                 continue
 
-        # Save updated archive
-        if synced_count > 0:
+        # Copy files to sync folder with .txt extension, several at a time.
+        # Files are handed out in batches so large syncs of small files don't
+        # pay a future and thread hand-off per file; only this thread updates
+        # the archive set.
+        if pending:
+            items = list(pending.items())
+            workers = min(_COPY_WORKERS, len(items))
+            batch_size = min(_COPY_BATCH_SIZE, -(-len(items) // workers))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {}
+                for start in range(0, len(items), batch_size):
+                    batch = items[start:start + batch_size]
+                    jobs = [
+                        (source_file, os.path.join(sync_folder, dest_filename))
+                        for dest_filename, (source_file, _) in batch
+                    ]
+                    futures[executor.submit(_copy_batch, jobs)] = batch
+
+                for future in as_completed(futures):
+                    for (dest_filename, (_, source_name)), error in zip(futures[future], future.result()):
+                        if error is not None:
+                            self.logger.error("Failed to sync %s: %s", source_name, error)
+                            continue
+                        self.logger.info("Synced subtitle: %s -> %s", source_name, dest_filename)
+
+                        # Add to archive
+                        self.synced_files.add(source_name)
+                        synced_count += 1
+
+        # Save updated archive (also when entries were healed without copying)
+        if synced_count > 0 or len(self.synced_files) != archived_count:
             self._save_archive()
 
         if synced_count > 0:
-            self.logger.info(f"Sync complete: {synced_count} synced, {skipped_count} skipped")
+            self.logger.info("Sync complete: %d synced, %d skipped", synced_count, skipped_count)
 
         return (synced_count, skipped_count)
 
-    def sync_new_subtitle(self, subtitle_path: Path) -> bool:
+    def sync_new_subtitle(self, subtitle_path: Path, skip_validation: bool = False) -> bool:
         """
         Sync a single newly downloaded subtitle file.
 
         Args:
             subtitle_path: Path to the subtitle file to sync
+            skip_validation: Trust that the file exists and is an .srt file
+                (for callers that just wrote it)
 
         Returns:
             True if synced successfully, False otherwise
         """
-        if not subtitle_path.exists() or not subtitle_path.suffix == '.srt':
-            self.logger.warning(f"Invalid subtitle file: {subtitle_path}")
+        name = subtitle_path.name
+        if not skip_validation and (not name.endswith('.srt') or not subtitle_path.exists()):
+            self.logger.warning("Invalid subtitle file: %s", subtitle_path)
             return False
 
         # Change extension from .srt to .txt
-        dest_filename = subtitle_path.stem + '.txt'
-        dest_file = self.sync_folder / dest_filename
+        dest_filename = name[:-4] + '.txt'
+        dest_file = os.path.join(self._sync_folder_str, dest_filename)
 
         try:
-            if self._should_sync_file(subtitle_path, dest_file):
+            was_archived = name in self.synced_files
+            if self._should_sync_file(subtitle_path, dest_filename):
                 # Copy file to sync folder with .txt extension
-                shutil.copy2(subtitle_path, dest_file)
-                self.logger.info(f"Synced new subtitle: {subtitle_path.name} -> {dest_filename}")
+                _fast_copy(subtitle_path, dest_file)
+                self.logger.info("Synced new subtitle: %s -> %s", name, dest_filename)
 
                 # Add to archive
-                self.synced_files.add(subtitle_path.name)
-                self._save_archive()
+                self.synced_files.add(name)
+                self._archive_writer.put(name)
 
                 return True
             else:
-                self.logger.debug(f"Subtitle already synced: {subtitle_path.name}")
+                if not was_archived:
+                    # Healed from an existing copy in the sync folder
+                    self._archive_writer.put(name)
+                self.logger.debug("Subtitle already synced: %s", name)
                 return False
 
         except Exception as e:
-            self.logger.error(f"Failed to sync {subtitle_path.name}: {e}")
+            self.logger.error("Failed to sync %s: %s", name, e)
             return False
 
 
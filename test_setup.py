@@ -80,18 +80,17 @@ def test_config_file():
 
 
 def test_dependencies():
-    """Check if Python dependencies are installed"""
+    """Check optional Python dependencies"""
     try:
-        import schedule
-        print_status("Python dependencies", True, "schedule module found")
-        return True
+        import yt_dlp  # noqa: F401
+        print_status("Python dependencies", True, "yt_dlp module found (in-process mode)")
     except ImportError:
         print_status(
             "Python dependencies",
-            False,
-            "Run: pip install -r requirements.txt"
+            True,
+            "yt_dlp module not installed (optional, falls back to yt-dlp command)"
         )
-        return False
+    return True
 
 
 def test_directories():
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for PlaylistDownloader's subtitle download paths.
+Run with: python -m unittest discover tests
+"""
+
+import json
+import logging
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import downloader  # noqa: E402
+from downloader import PlaylistDownloader  # noqa: E402
+
+
+def _make_downloader(tmp: str, **config) -> PlaylistDownloader:
+    """Create a downloader with a throwaway config, log file and download path."""
+    config_path = os.path.join(tmp, 'config.json')
+    with open(config_path, 'w') as f:
+        json.dump({
+            'playlist_url': 'https://www.youtube.com/playlist?list=TEST',
+            'download_path': os.path.join(tmp, 'downloads'),
+            'log_file': os.path.join(tmp, 'downloader.log'),
+            'yt_dlp_options': {'cookies_from_browser': 'firefox'},
+            **config,
+        }, f)
+    pd = PlaylistDownloader(config_path)
+    # Keep test output quiet; records still reach the queue handler
+    logging.getLogger('PlaylistDownloader').setLevel(logging.CRITICAL)
+    return pd
+
+
+@unittest.skipIf(downloader.yt_dlp is None, "yt_dlp package not installed")
+class InProcessSrtTest(unittest.TestCase):
+    """SRT downloads through the yt_dlp Python API."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.pd = _make_downloader(self._tmp.name)
+        self.addCleanup(self._tmp.cleanup)
+        self.addCleanup(self.pd.close)
+        # No browser profile here; reading its cookies would fail before extraction
+        self.pd._ydl_srt_opts.pop('cookiesfrombrowser', None)
+
+    def test_failing_extractor_is_reported_as_failure(self):
+        yt_dlp = downloader.yt_dlp
+        error = yt_dlp.utils.ExtractorError('Video unavailable', expected=True)
+        with mock.patch.object(yt_dlp.extractor.youtube.YoutubeIE, '_real_extract', side_effect=error):
+            results = self.pd._download_srt_in_process(['aaaaaaaaaaa'])
+        self.assertEqual(results, {'aaaaaaaaaaa': False})
+
+    def test_extraction_without_srt_file_is_reported_as_failure(self):
+        with mock.patch.object(downloader.yt_dlp.YoutubeDL, 'extract_info', return_value={}):
+            results = self.pd._download_srt_in_process(['aaaaaaaaaaa'])
+        self.assertEqual(results, {'aaaaaaaaaaa': False})
+
+    def test_srt_file_on_disk_is_reported_as_success(self):
+        def write_srt(ydl, url, *args, **kwargs):
+            srt = Path(self._tmp.name, 'downloads', 'Title [aaaaaaaaaaa].en.srt')
+            srt.write_text('1\n00:00:00,000 --> 00:00:01,000\nhi\n')
+            return {}
+
+        with mock.patch.object(downloader.yt_dlp.YoutubeDL, 'extract_info', autospec=True, side_effect=write_srt):
+            results = self.pd._download_srt_in_process(['aaaaaaaaaaa'])
+        self.assertEqual(results, {'aaaaaaaaaaa': True})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for SubtitleSyncer's file copy fallbacks.
+Run with: python -m unittest discover tests
+"""
+
+import errno
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import subtitle_syncer  # noqa: E402
+from subtitle_syncer import _fast_copy  # noqa: E402
+
+
+def _unsupported(*args, **kwargs):
+    raise OSError(errno.ENOSYS, "not supported")
+
+
+class FastCopyTest(unittest.TestCase):
+    """_fast_copy produces an identical file whichever copy path is taken."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.src = os.path.join(self._tmp.name, 'src.srt')
+        self.dst = os.path.join(self._tmp.name, 'dst.txt')
+        # Larger than one userspace buffer so the fallback loops
+        self.data = os.urandom(subtitle_syncer._COPY_BUFFER_SIZE * 2 + 12345)
+        with open(self.src, 'wb') as f:
+            f.write(self.data)
+        # A stale, longer destination must be truncated
+        with open(self.dst, 'wb') as f:
+            f.write(b'x' * (len(self.data) + 100))
+
+    def assertCopied(self):
+        with open(self.dst, 'rb') as f:
+            self.assertEqual(f.read(), self.data)
+
+    def test_default_path(self):
+        _fast_copy(self.src, self.dst)
+        self.assertCopied()
+
+    @unittest.skipUnless(hasattr(os, 'sendfile'), "os.sendfile not available")
+    def test_sendfile_fallback(self):
+        with mock.patch.object(subtitle_syncer.sys, 'platform', 'linux'), \
+                mock.patch.object(subtitle_syncer.os, 'copy_file_range', _unsupported, create=True), \
+                mock.patch.object(subtitle_syncer.os, 'sendfile', wraps=os.sendfile) as sendfile:
+            _fast_copy(self.src, self.dst)
+        self.assertTrue(sendfile.called)
+        self.assertCopied()
+
+    def test_readinto_fallback(self):
+        with mock.patch.object(subtitle_syncer.os, 'copy_file_range', _unsupported, create=True), \
+                mock.patch.object(subtitle_syncer.os, 'sendfile', _unsupported, create=True):
+            _fast_copy(self.src, self.dst)
+        self.assertCopied()
+
+    def test_sendfile_not_used_off_linux(self):
+        # macOS has no copy_file_range and its sendfile rejects regular files
+        sendfile = mock.Mock(side_effect=TypeError("an integer is required"))
+        with mock.patch.object(subtitle_syncer.sys, 'platform', 'darwin'), \
+                mock.patch.object(subtitle_syncer.os, 'copy_file_range', _unsupported, create=True), \
+                mock.patch.object(subtitle_syncer.os, 'sendfile', sendfile, create=True):
+            _fast_copy(self.src, self.dst)
+        sendfile.assert_not_called()
+        self.assertCopied()
+
+
+if __name__ == '__main__':
+    unittest.main()